@@ -6,12 +6,12 @@ Project: Game of Chess AI
 File: ai.py
 Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
 Created: 2025-11-05
-Updated: 2025-11-05
+Updated: 2026-10-15
 License: MIT License (see LICENSE file for details)
 =
 
 Description:
-Implements a simple chess AI based on minimax search with alpha–beta pruning and a hand-crafted
+Implements a simple chess AI based on negamax search with alpha–beta pruning and a hand-crafted
 static evaluation function.
 
 Usage:
@@ -23,156 +23,437 @@ move = find_best_move(board, max_depth=3)
 
 Notes:
 - The evaluation function is intentionally simple but structured for easy experimentation.
-- No transposition tables or advanced heuristics are used in this baseline implementation.
+- Positions are cached in a Zobrist-keyed transposition table for the duration of one search.
+- Scores are integer centipawns; a forced mate scores ``MATE`` minus its distance in plies.
+- Leaf positions are extended with a captures-only quiescence search to limit the horizon effect.
+- ``find_best_move(board, threads=N)`` runs a Lazy SMP search: N threads search the same root and
+  share only the transposition table. Under the CPython GIL the threads interleave rather than run
+  in parallel, so this mainly pays off on free-threaded builds.
 =================================================================================================================
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional, Tuple
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 
-from .board import Board, Color, Move
+from .board import WHITE, Board, Move
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SearchResult:
-    """Container for search results (best move and its score)."""
+    """Container for search results (best move, its score and search statistics)."""
 
     move: Optional[Move]
-    score: float
+    score: int  # centipawns
+    tt_hits: int = 0  # transposition table probes that found the position
+    nodes: int = 0  # positions visited by negamax and quiescence search, over all threads
 
 
-# Material values (in pawns)
-PIECE_VALUES = {
-    "P": 1.0,
-    "N": 3.0,
-    "B": 3.25,
-    "R": 5.0,
-    "Q": 9.0,
-    "K": 0.0,  # King's value is implicit; losing it is game over
-}
+@dataclass(frozen=True, slots=True)
+class SearchConfig:
+    """Tunable search options.
 
+    Attributes:
+        move_ordering: Sort main-search moves (TT move, MVV-LVA captures, killers, history) before
+            searching them. Turning it off is only useful to measure how much work the ordering
+            saves. Quiescence captures are always MVV-LVA ordered, since without that the capture
+            trees of tactical positions grow too large to finish.
+    """
+
+    move_ordering: bool = True
+
+
+# Transposition table bound types
+EXACT, LOWER, UPPER = 0, 1, 2
+
+# Deepest ply tracked by the killer-move table
+MAX_PLY = 64
+
+# Score bounds in centipawns. Being mated ``ply`` plies from the root scores ``-(MATE - ply)`` so
+# that shorter mates are preferred; anything beyond ``MATE_BOUND`` in magnitude is a mate score.
+INF = 10**9
+MATE = 10**7
+MATE_BOUND = MATE - 10_000
+
+# (key, depth, score, flag, best_move) where best_move is a packed move, or 0 if unknown
+TTEntry = Tuple[int, int, int, int, int]
+
+
+class TranspositionTable:
+    """Fixed-size transposition table indexed by the low bits of a position's Zobrist key.
+
+    Each slot holds a single entry and is always overwritten by the most recent store. The full key
+    is kept in the entry so that index collisions are detected on probe. Entries are immutable
+    tuples replaced by a single list assignment, so threads may share a table without locking: a
+    reader sees either the old or the new entry, never a mix of both.
+    """
+
+    __slots__ = ("size", "hits", "_mask", "_slots")
+
+    def __init__(self, size_log2: int = 18) -> None:
+        self.size = 1 << size_log2
+        self.hits = 0
+        self._mask = self.size - 1
+        self._slots: List[Optional[TTEntry]] = [None] * self.size
+
+    def probe(self, key: int) -> Optional[TTEntry]:
+        entry = self._slots[key & self._mask]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def store(self, key: int, depth: int, score: int, flag: int, best_move: int) -> None:
+        self._slots[key & self._mask] = (key, depth, score, flag, best_move)
+
+
+@dataclass(slots=True)
+class SearchContext:
+    """State shared by all nodes of one search.
+
+    Attributes:
+        tt: Transposition table for the search.
+        move_buffers: One reusable packed-move list per ply, so sibling nodes at the same ply fill
+            the same list instead of allocating a new one.
+        killers: Two most recent quiet moves per ply that caused a beta cut-off.
+        history: Cut-off counters for quiet moves, indexed by ``piece_index * 64 + to_square``
+            and bumped by ``depth * depth``.
+        stop: Event that aborts the search when set (used by Lazy SMP helper threads), or None.
+        config: Search options.
+        nodes: Number of positions visited so far.
+    """
+
+    tt: TranspositionTable = field(default_factory=TranspositionTable)
+    move_buffers: List[List[int]] = field(default_factory=list)
+    killers: List[Tuple[int, int]] = field(default_factory=lambda: [(0, 0)] * MAX_PLY)
+    history: List[int] = field(default_factory=lambda: [0] * (12 * 64))
+    stop: Optional[threading.Event] = None
+    config: SearchConfig = field(default_factory=SearchConfig)
+    nodes: int = 0
+
+    def record_cutoff(self, board: Board, move: int, depth: int, ply: int) -> None:
+        """Update killer and history tables after a cut-off by ``move`` (captures are ignored)."""
+
+        to_sq = (move >> 6) & 63
+        if move >= 4096 or (board.all_occ >> to_sq) & 1:
+            return
+        first, _ = self.killers[ply]
+        if move != first:
+            self.killers[ply] = (move, first)
+        self.history[board.piece_index_at(move & 63) * 64 + to_sq] += depth * depth
+
+    def move_buffer(self, ply: int) -> List[int]:
+        """Return the (emptied) move buffer for nodes ``ply`` plies from the root."""
 
-def evaluate_board(board: Board) -> float:
-    """Evaluate a position from White's perspective.
+        buffers = self.move_buffers
+        while len(buffers) <= ply:
+            buffers.append([])
+        moves = buffers[ply]
+        moves.clear()
+        return moves
+
+
+class _SearchAborted(Exception):
+    """Raised inside a search whose context's ``stop`` event has been set."""
+
+
+def _score_to_tt(score: int, ply: int) -> int:
+    """Make a mate score relative to the node at ``ply`` before storing it in the table."""
+
+    if score >= MATE_BOUND:
+        return score + ply
+    if score <= -MATE_BOUND:
+        return score - ply
+    return score
+
+
+def _score_from_tt(score: int, ply: int) -> int:
+    """Turn a node-relative mate score from the table back into a root-relative one."""
+
+    if score >= MATE_BOUND:
+        return score - ply
+    if score <= -MATE_BOUND:
+        return score + ply
+    return score
+
+
+def evaluate_board(board: Board) -> int:
+    """Evaluate a position from White's perspective, in centipawns.
 
     Positive values are good for White, negative values are good for Black.
-    The current implementation uses a simple material count. You can extend this to include:
+    The score is material plus piece-square bonuses (see ``chess_ai.evaluation``). The board keeps
+    that sum up to date in ``make``/``unmake``, so evaluation is a single attribute read. You can
+    extend this to include:
 
-    - Piece-square tables
     - Mobility (number of legal moves)
     - King safety, pawn structure, etc.
     """
 
-    material = 0.0
-    for row in range(8):
-        for col in range(8):
-            piece = board.piece_at((row, col))
-            if piece is None:
-                continue
-            base = PIECE_VALUES.get(piece.upper(), 0.0)
-            if piece.isupper():
-                material += base
-            else:
-                material -= base
-    return material
+    return board.psq_score
 
 
-def minimax(
+def negamax(
     board: Board,
     depth: int,
-    alpha: float,
-    beta: float,
-    maximizing_color: Color,
-) -> float:
-    """Minimax search with alpha–beta pruning.
+    alpha: int,
+    beta: int,
+    ctx: Optional[SearchContext] = None,
+    ply: int = 0,
+) -> int:
+    """Negamax search with alpha–beta pruning.
+
+    Scores are always from the perspective of the side to move, so a child's score is negated and
+    searched with the window ``(-beta, -alpha)``; one code path serves both colors.
 
     Args:
-        board: Current position.
-        depth: Remaining search depth.
-        alpha: Alpha bound.
-        beta: Beta bound.
-        maximizing_color: The color whose perspective we are optimizing (usually "white").
+        board: Current position. Moves are made and unmade in place, so the board is back in its
+            original state when the call returns.
+        depth: Remaining search depth. At zero the position is resolved by ``qsearch``.
+        alpha: Lower bound of the search window.
+        beta: Upper bound of the search window.
+        ctx: Search state (transposition table and move buffers); a fresh one is created if
+            omitted.
+        ply: Distance from the root, used to index the killer-move table and score mates.
     """
 
-    if depth == 0:
-        score = evaluate_board(board)
-        return score if maximizing_color == "white" else -score
+    if ctx is None:
+        ctx = SearchContext()
+    if ctx.stop is not None and ctx.stop.is_set():
+        raise _SearchAborted
+    if depth <= 0:
+        # qsearch counts this node itself
+        return qsearch(board, alpha, beta, ctx, ply)
+    ctx.nodes += 1
+
+    tt = ctx.tt
+    alpha_orig, beta_orig = alpha, beta
+    tt_move = 0
+    entry = tt.probe(board.zobrist)
+    if entry is not None:
+        _, entry_depth, entry_score, flag, tt_move = entry
+        entry_score = _score_from_tt(entry_score, ply)
+        if entry_depth >= depth:
+            if flag == EXACT:
+                return entry_score
+            if flag == LOWER:
+                alpha = max(alpha, entry_score)
+            else:
+                beta = min(beta, entry_score)
+            if alpha >= beta:
+                return entry_score
 
-    side_to_move = board.turn
-    legal_moves = board.generate_legal_moves(side_to_move)
+    side_to_move = board.side
+    legal_moves = ctx.move_buffer(ply)
+    board.gen_legal_moves(side_to_move, legal_moves)
 
     if not legal_moves:
-        # Checkmate or stalemate
-        if board.is_in_check(side_to_move):
-            # If the side to move is the maximizing side, this is very bad; otherwise it's very good.
-            mate_score = -10_000.0 if side_to_move == maximizing_color else 10_000.0
-            return mate_score
-        # Stalemate -> draw
-        return 0.0
-
-    is_maximizing_player = side_to_move == maximizing_color
-
-    if is_maximizing_player:
-        value = float("-inf")
-        for move in legal_moves:
-            child = board.apply_move(move)
-            value = max(value, minimax(child, depth - 1, alpha, beta, maximizing_color))
-            alpha = max(alpha, value)
-            if alpha >= beta:
-                break  # beta cut-off
-        return value
-
-    # Minimizing player
-    value = float("inf")
+        # Checkmate (the side to move has lost) or stalemate (a draw)
+        return -(MATE - ply) if board.in_check(side_to_move) else 0
+
+    # Try the best move from a previous visit first, then captures, for earlier cut-offs
+    if ctx.config.move_ordering:
+        killers = ctx.killers[ply] if ply < MAX_PLY else (0, 0)
+        board.order_moves(legal_moves, tt_move, killers, ctx.history)
+
+    best_move = legal_moves[0]
+    value = -INF
+    make, unmake = board.make, board.unmake
+    child_depth = depth - 1
     for move in legal_moves:
-        child = board.apply_move(move)
-        value = min(value, minimax(child, depth - 1, alpha, beta, maximizing_color))
-        beta = min(beta, value)
-        if beta <= alpha:
-            break  # alpha cut-off
+        undo = make(move)
+        # Horizon children go straight to quiescence search instead of through a negamax frame
+        if child_depth:
+            score = -negamax(board, child_depth, -beta, -alpha, ctx, ply + 1)
+        else:
+            score = -qsearch(board, -beta, -alpha, ctx, ply + 1)
+        unmake(undo)
+        if score > value:
+            value = score
+            best_move = move
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    if ply < MAX_PLY:
+                        ctx.record_cutoff(board, move, depth, ply)
+                    break  # beta cut-off
+
+    if value <= alpha_orig:
+        flag = UPPER
+    elif value >= beta_orig:
+        flag = LOWER
+    else:
+        flag = EXACT
+    tt.store(board.zobrist, depth, _score_to_tt(value, ply), flag, best_move)
+    return value
+
+
+def qsearch(board: Board, alpha: int, beta: int, ctx: SearchContext, ply: int = 0) -> int:
+    """Quiescence search: resolve captures and promotions before trusting the static evaluation.
+
+    The side to move may "stand pat" on the static evaluation unless it is in check, in which case
+    every evasion is searched (and having none is checkmate). Scores follow the same convention as
+    ``negamax``. The transposition table is probed for cut-offs but not written, so quiescence
+    results never overwrite entries from the main search.
+    """
+
+    ctx.nodes += 1
+    entry = ctx.tt.probe(board.zobrist)
+    if entry is not None:
+        _, _, entry_score, flag, _ = entry
+        entry_score = _score_from_tt(entry_score, ply)
+        if flag == EXACT:
+            return entry_score
+        if flag == LOWER and entry_score >= beta:
+            return entry_score
+        if flag == UPPER and entry_score <= alpha:
+            return entry_score
+
+    side_to_move = board.side
+    in_check = board.in_check(side_to_move)
+    if in_check:
+        value = -INF
+    else:
+        # Stand pat: the side to move is assumed able to do at least as well as the static score.
+        # Checked before generating any moves, since a fail-high here makes them unnecessary.
+        value = evaluate_board(board)
+        if side_to_move != WHITE:
+            value = -value
+        if value >= beta:
+            return value
+        alpha = max(alpha, value)
+
+    moves = ctx.move_buffer(ply)
+    board.gen_legal_moves(side_to_move, moves, tactical_only=not in_check)
+    if in_check and not moves:
+        return -(MATE - ply)
+
+    board.order_moves(moves)
+    make, unmake = board.make, board.unmake
+    for move in moves:
+        undo = make(move)
+        score = -qsearch(board, -beta, -alpha, ctx, ply + 1)
+        unmake(undo)
+        if score > value:
+            value = score
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break
     return value
 
 
-def find_best_move(board: Board, max_depth: int = 3) -> SearchResult:
-    """Compute the best move for the side to move using minimax with alpha–beta pruning.
+def _search_root(
+    board: Board, depth: int, legal_moves: List[int], ctx: SearchContext
+) -> Tuple[int, int]:
+    """Search all root moves to ``depth`` plies, trying the transposition table's best move first.
+
+    Returns the best packed move and its score from the perspective of the side to move. The result
+    is stored in the transposition table so that the next, deeper iteration starts with this
+    iteration's best move.
+    """
+
+    if ctx.config.move_ordering:
+        entry = ctx.tt.probe(board.zobrist)
+        board.order_moves(legal_moves, entry[4] if entry is not None else 0)
+
+    alpha = -INF
+    best_move = legal_moves[0]
+    for move in legal_moves:
+        undo = board.make(move)
+        score = -negamax(board, depth - 1, -INF, -alpha, ctx, ply=1)
+        board.unmake(undo)
+        if score > alpha:
+            alpha = score
+            best_move = move
+
+    ctx.tt.store(board.zobrist, depth, alpha, EXACT, best_move)
+    return best_move, alpha
+
+
+def _lazy_smp_helper(root: Board, max_depth: int, start_depth: int, ctx: SearchContext) -> None:
+    """Iteratively deepen from ``root`` until done or ``ctx.stop`` is set.
+
+    ``root`` must be a copy owned by this helper. Helpers only contribute through the shared
+    transposition table; their own results are dropped.
+    """
+
+    legal_moves: List[int] = []
+    root.gen_legal_moves(root.side, legal_moves)
+    try:
+        for depth in range(start_depth, max_depth + 1):
+            _search_root(root, depth, legal_moves, ctx)
+    except _SearchAborted:
+        pass
+
+
+def find_best_move(
+    board: Board,
+    max_depth: int = 3,
+    threads: int = 1,
+    search_config: Optional[SearchConfig] = None,
+) -> SearchResult:
+    """Compute the best move for the side to move using negamax with alpha–beta pruning.
+
+    The search is iteratively deepened: depths 1, 2, ..., ``max_depth`` are searched in turn, and
+    each iteration tries the previous iteration's best moves first (via the transposition table),
+    which makes alpha–beta cut-offs far more effective at the final depth.
+
+    With ``threads > 1`` the extra threads run the same iterative deepening (every other helper
+    one ply ahead) against the shared transposition table, filling it with results the main search
+    then picks up. The main thread's result is returned and the helpers are stopped once it is done.
 
     Args:
         board: Position for which to find the best move.
         max_depth: Search depth (plies).
+        threads: Number of search threads, including the calling thread.
+        search_config: Search options; the defaults are used if omitted.
 
     Returns:
-        SearchResult containing the chosen move and its evaluation score.
+        SearchResult containing the chosen move and its evaluation score from the perspective of
+        the side to move.
     """
 
-    side_to_move = board.turn
-    legal_moves = board.generate_legal_moves(side_to_move)
+    # The search makes and unmakes moves in place, so work on a private copy of the position
+    root = board.clone()
+    side_to_move = root.side
+    legal_moves: List[int] = []
+    root.gen_legal_moves(side_to_move, legal_moves)
     if not legal_moves:
         # No moves available
-        if board.is_in_check(side_to_move):
-            score = -10_000.0 if side_to_move == "white" else 10_000.0
-        else:
-            score = 0.0
+        score = -MATE if root.in_check(side_to_move) else 0
         return SearchResult(move=None, score=score)
 
-    best_move: Optional[Move] = None
-    if side_to_move == "white":
-        best_score = float("-inf")
-    else:
-        best_score = float("inf")
-
-    for move in legal_moves:
-        child = board.apply_move(move)
-        score = minimax(child, max_depth - 1, alpha=float("-inf"), beta=float("inf"), maximizing_color=side_to_move)
-
-        if side_to_move == "white":
-            if score > best_score:
-                best_score = score
-                best_move = move
-        else:
-            if score < best_score:
-                best_score = score
-                best_move = move
-
-    return SearchResult(move=best_move, score=best_score)
\ No newline at end of file
+    max_depth = max(1, max_depth)
+    config = search_config if search_config is not None else SearchConfig()
+    ctx = SearchContext(config=config)
+    stop = threading.Event()
+    helper_contexts = [
+        SearchContext(tt=ctx.tt, stop=stop, config=config) for _ in range(1, max(1, threads))
+    ]
+    helpers = [
+        threading.Thread(
+            target=_lazy_smp_helper,
+            args=(root.clone(), max_depth, min(1 + (i & 1), max_depth), helper_ctx),
+            daemon=True,
+        )
+        for i, helper_ctx in enumerate(helper_contexts, start=1)
+    ]
+    for helper in helpers:
+        helper.start()
+
+    best_move, best_score = legal_moves[0], 0
+    try:
+        for depth in range(1, max_depth + 1):
+            best_move, best_score = _search_root(root, depth, legal_moves, ctx)
+    finally:
+        stop.set()
+        for helper in helpers:
+            helper.join()
+    return SearchResult(
+        move=Move.from_packed(best_move),
+        score=best_score,
+        tt_hits=ctx.tt.hits,
+        nodes=ctx.nodes + sum(helper_ctx.nodes for helper_ctx in helper_contexts),
+    )
\ No newline at end of file
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=================================================================================================================
+Project: Game of Chess AI
+File: bitboards.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-15
+Updated: 2026-10-15
+License: MIT License (see LICENSE file for details)
+=
+
+Description:
+Precomputed bitboard attack tables used by move generation. Every table is indexed by a LERF square
+index (a1=0, h8=63) and built once at import time. Sliding attacks for rooks, bishops and queens use
+magic bitboards: the relevant blockers of a square are hashed with a multiply-and-shift into a
+per-square attack table. ``BETWEEN`` and ``LINE`` describe the geometry between two squares and are
+used for check evasions and pins.
+
+Usage:
+from chess_ai.bitboards import KNIGHT_ATTACKS, rook_attacks
+
+targets = KNIGHT_ATTACKS[sq] & ~own_occupancy
+targets = rook_attacks(sq, all_occupancy) & ~own_occupancy
+
+Notes:
+- Bitboards are plain Python ints restricted to 64 bits.
+- The magic numbers were found offline by random search and are shipped as constants; the attack
+  tables themselves are rebuilt from them on import.
+=================================================================================================================
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Tuple
+
+BB_MASK = 0xFFFF_FFFF_FFFF_FFFF
+FILE_A = 0x0101_0101_0101_0101
+FILE_H = FILE_A << 7
+RANK_1 = 0xFF
+RANK_3 = RANK_1 << 16
+RANK_6 = RANK_1 << 40
+RANK_8 = RANK_1 << 56
+
+_KNIGHT_DELTAS = ((2, -1), (2, 1), (1, -2), (1, 2), (-1, -2), (-1, 2), (-2, -1), (-2, 1))
+_KING_DELTAS = ((1, -1), (1, 0), (1, 1), (0, -1), (0, 1), (-1, -1), (-1, 0), (-1, 1))
+_BISHOP_DIRECTIONS = ((1, -1), (1, 1), (-1, -1), (-1, 1))
+_ROOK_DIRECTIONS = ((1, 0), (-1, 0), (0, -1), (0, 1))
+
+
+def _step_attacks(sq: int, deltas: Iterable[Tuple[int, int]]) -> int:
+    """Return the bitboard of squares reachable from ``sq`` by a single (rank, file) step."""
+
+    rank, file = sq >> 3, sq & 7
+    attacks = 0
+    for dr, df in deltas:
+        r, f = rank + dr, file + df
+        if 0 <= r < 8 and 0 <= f < 8:
+            attacks |= 1 << (r * 8 + f)
+    return attacks
+
+
+KNIGHT_ATTACKS: Tuple[int, ...] = tuple(_step_attacks(sq, _KNIGHT_DELTAS) for sq in range(64))
+KING_ATTACKS: Tuple[int, ...] = tuple(_step_attacks(sq, _KING_DELTAS) for sq in range(64))
+# PAWN_ATTACKS[color][sq]: squares attacked by a pawn of ``color`` (0=white, 1=black) standing on sq
+PAWN_ATTACKS: Tuple[Tuple[int, ...], ...] = (
+    tuple(_step_attacks(sq, ((1, -1), (1, 1))) for sq in range(64)),
+    tuple(_step_attacks(sq, ((-1, -1), (-1, 1))) for sq in range(64)),
+)
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Magic bitboards for sliding pieces
+# ---------------------------------------------------------------------------------------------------------------------
+
+# fmt: off
+ROOK_MAGICS: Tuple[int, ...] = (
+    0x1980001080224001, 0x0040200040001000, 0x0100104020000900, 0x2080100204080080,
+    0x4600020008500421, 0x9600481001040200, 0x4080020000800100, 0x210002284E018100,
+    0x0001800220400080, 0x0C48402000401002, 0x0021002000410810, 0x0203002090010008,
+    0x0120808008000400, 0x090A000804220050, 0x2201010200040100, 0x0001000041002082,
+    0xA040088000902040, 0x2000820040220100, 0x0202020040208011, 0x002212000821C200,
+    0x0242020004081020, 0x0500808004000201, 0x0080040008010210, 0x0020020001008044,
+    0x1400400380008030, 0x4010005040002000, 0x000A208200160040, 0x4040100080080080,
+    0x0C14000808008040, 0x0032000200040810, 0x0431000900040A00, 0x8000806600040289,
+    0x8008854202002300, 0x5002108102002040, 0x0220801001802008, 0x0008001000808008,
+    0x0424008024802800, 0x0000040080800200, 0x004001380C000290, 0x40800C0042000891,
+    0x1060904008208000, 0x0410005820004002, 0x0090040068012000, 0xB200100008008080,
+    0x0020080004008080, 0x0082008490020008, 0x2010021001040008, 0x000400488102002C,
+    0x0040810200402200, 0x0800804000200880, 0x821490824200A200, 0x006010400A002200,
+    0x0014008008000480, 0x0045000204008900, 0x0440081051028400, 0x0008244405008200,
+    0x2120402080010011, 0x880A022100401582, 0x0A00082010820042, 0x00026D0030012029,
+    0x70A1001148000515, 0x008A00B001042802, 0x5084100108008244, 0x004C008100440022,
+)
+
+BISHOP_MAGICS: Tuple[int, ...] = (
+    0x01904C0828440C20, 0x0020045404404200, 0x00040C041440000C, 0x1208204040185100,
+    0x0004042001000B21, 0x0E00821040000040, 0x9004020144A18000, 0xA010104208044048,
+    0x00002020840086A2, 0xC00465100C010020, 0x0008114404054000, 0x863A082040500000,
+    0x0082020210000812, 0x2000460524200C08, 0x0040028401C84000, 0x0044010092016080,
+    0x021010A003102D00, 0x0084110208081100, 0x0042040404101200, 0x0088042104110020,
+    0x0001001990400030, 0x0805000204860701, 0x8848800900882080, 0x0022020082010100,
+    0x0460211144044480, 0x1A04028210420801, 0x0000410008020400, 0x0004004004010002,
+    0x4882840082802000, 0x0014420089048200, 0x0002420008882118, 0x0001610002078201,
+    0x0301101000482081, 0x8004E20800103000, 0x0182020100088800, 0x0000020080580080,
+    0x0104040400281010, 0x0042008101020041, 0x0024010044220820, 0xA01232002B020082,
+    0x0000820820A0400A, 0x1801461010208C30, 0x0042208020881004, 0x0400A0C208002880,
+    0x5200084104000040, 0x0408110800200A00, 0x000404080060020C, 0x0001020206110840,
+    0x2006080104901100, 0x8046124918080401, 0x815164208C108000, 0x0000040094140000,
+    0x00000044450C0041, 0x1000410891410282, 0x0040028421020002, 0x4042080244004900,
+    0x060201004110080A, 0x0010490948025842, 0x6301220822011040, 0x0802240080208821,
+    0x2004500A40228200, 0x00000108A0482220, 0x8288084230040108, 0x0420281104509200,
+)
+# fmt: on
+
+
+def _ray_attacks(sq: int, occupancy: int, directions: Iterable[Tuple[int, int]]) -> int:
+    """Return sliding attacks from ``sq`` along ``directions``, stopping at the first blocker."""
+
+    rank, file = sq >> 3, sq & 7
+    attacks = 0
+    for dr, df in directions:
+        r, f = rank + dr, file + df
+        while 0 <= r < 8 and 0 <= f < 8:
+            bit = 1 << (r * 8 + f)
+            attacks |= bit
+            if occupancy & bit:
+                break
+            r += dr
+            f += df
+    return attacks
+
+
+def _relevant_mask(sq: int, directions: Iterable[Tuple[int, int]]) -> int:
+    """Return the squares whose occupancy can change sliding attacks from ``sq`` (no edges)."""
+
+    rank, file = sq >> 3, sq & 7
+    mask = 0
+    for dr, df in directions:
+        r, f = rank + dr, file + df
+        while 0 <= r + dr < 8 and 0 <= f + df < 8:
+            mask |= 1 << (r * 8 + f)
+            r += dr
+            f += df
+    return mask
+
+
+def _build_magic_tables(
+    magics: Tuple[int, ...], directions: Iterable[Tuple[int, int]]
+) -> Tuple[Tuple[int, ...], Tuple[int, ...], Tuple[Tuple[int, ...], ...]]:
+    masks: List[int] = []
+    shifts: List[int] = []
+    tables: List[Tuple[int, ...]] = []
+    for sq in range(64):
+        mask = _relevant_mask(sq, directions)
+        shift = 64 - mask.bit_count()
+        magic = magics[sq]
+        table = [0] * (1 << mask.bit_count())
+        # Enumerate every subset of the mask with the carry-rippler trick
+        subset = 0
+        while True:
+            table[((subset * magic) & BB_MASK) >> shift] = _ray_attacks(sq, subset, directions)
+            subset = (subset - mask) & mask
+            if not subset:
+                break
+        masks.append(mask)
+        shifts.append(shift)
+        tables.append(tuple(table))
+    return tuple(masks), tuple(shifts), tuple(tables)
+
+
+ROOK_MASKS, ROOK_SHIFTS, ROOK_TABLES = _build_magic_tables(ROOK_MAGICS, _ROOK_DIRECTIONS)
+BISHOP_MASKS, BISHOP_SHIFTS, BISHOP_TABLES = _build_magic_tables(BISHOP_MAGICS, _BISHOP_DIRECTIONS)
+
+
+def rook_attacks(sq: int, occupancy: int) -> int:
+    """Return the rook attack bitboard from ``sq`` given the full board occupancy."""
+
+    return ROOK_TABLES[sq][
+        (((occupancy & ROOK_MASKS[sq]) * ROOK_MAGICS[sq]) & BB_MASK) >> ROOK_SHIFTS[sq]
+    ]
+
+
+def bishop_attacks(sq: int, occupancy: int) -> int:
+    """Return the bishop attack bitboard from ``sq`` given the full board occupancy."""
+
+    return BISHOP_TABLES[sq][
+        (((occupancy & BISHOP_MASKS[sq]) * BISHOP_MAGICS[sq]) & BB_MASK) >> BISHOP_SHIFTS[sq]
+    ]
+
+
+def queen_attacks(sq: int, occupancy: int) -> int:
+    """Return the queen attack bitboard from ``sq`` (union of rook and bishop attacks)."""
+
+    return rook_attacks(sq, occupancy) | bishop_attacks(sq, occupancy)
+
+
+# ---------------------------------------------------------------------------------------------------------------------
+# Lines between squares
+# ---------------------------------------------------------------------------------------------------------------------
+
+
+def _build_line_tables() -> Tuple[Tuple[Tuple[int, ...], ...], Tuple[Tuple[int, ...], ...]]:
+    between = [[0] * 64 for _ in range(64)]
+    line = [[0] * 64 for _ in range(64)]
+    for a in range(64):
+        rank, file = a >> 3, a & 7
+        for dr, df in _ROOK_DIRECTIONS + _BISHOP_DIRECTIONS:
+            full = _ray_attacks(a, 0, ((dr, df), (-dr, -df))) | (1 << a)
+            ray = 0
+            r, f = rank + dr, file + df
+            while 0 <= r < 8 and 0 <= f < 8:
+                b = r * 8 + f
+                between[a][b] = ray
+                line[a][b] = full
+                ray |= 1 << b
+                r += dr
+                f += df
+    return tuple(map(tuple, between)), tuple(map(tuple, line))
+
+
+# BETWEEN[a][b]: squares strictly between a and b if they share a rank, file or diagonal, else 0.
+# LINE[a][b]: the whole line through a and b (both included) if they are aligned, else 0.
+BETWEEN, LINE = _build_line_tables()
\ No newline at end of file
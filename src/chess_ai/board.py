@@ -6,7 +6,7 @@ Project: Game of Chess AI
 File: board.py
 Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
 Created: 2025-11-05
-Updated: 2025-11-05
+Updated: 2026-10-15
 License: MIT License (see LICENSE file for details)
 =
 
@@ -23,21 +23,155 @@ legal_moves = board.generate_legal_moves("white")
 
 Notes:
 - Board coordinates are 0-based: (row, col) with row=0 at rank 8 and col=0 at file 'a'.
+- Internally the position is stored as bitboards using little-endian rank-file (LERF) square
+  indices: a1=0, b1=1, ..., h1=7, a2=8, ..., h8=63.
 - Moves use long algebraic notation like "e2e4" for CLI input/output.
 =================================================================================================================
 """
 
 from __future__ import annotations
 
+import random
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Iterable, List, Optional, Tuple
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+from .bitboards import (
+    BB_MASK,
+    BETWEEN,
+    FILE_A,
+    FILE_H,
+    KING_ATTACKS,
+    KNIGHT_ATTACKS,
+    LINE,
+    PAWN_ATTACKS,
+    RANK_1,
+    RANK_3,
+    RANK_6,
+    RANK_8,
+    bishop_attacks,
+    queen_attacks,
+    rook_attacks,
+)
+from .evaluation import PIECE_SQUARE_TABLES
 
 Color = str  # "white" or "black"
 Piece = str  # "P", "n", etc.
 Square = Tuple[int, int]  # (row, col)
+# (moved piece, placed piece, captured piece or -1, from index, to index, previous zobrist,
+#  previous piece-square score)
+UndoInfo = Tuple[int, int, int, int, int, int, int]
+
+# Internal side codes; the public API keeps "white"/"black" strings and converts at the boundary.
+WHITE, BLACK = 0, 1
+COLOR_NAMES: Tuple[Color, Color] = ("white", "black")
+
+# Piece codes double as bitboard indices: white pieces first, then black pieces, each as pawn,
+# knight, bishop, rook, queen, king. The code of a piece is ``6 * side + kind``.
+WP, WN, WB, WR, WQ, WK, BP, BN, BB, BR, BQ, BK = range(12)
+PIECE_SYMBOLS = "PNBRQKpnbrqk"
+_PIECE_INDEX = {symbol: index for index, symbol in enumerate(PIECE_SYMBOLS)}
+_COLOR_INDEX = {"white": WHITE, "black": BLACK}
+# Integer piece values used only for move ordering, indexed by bitboard index (0-11). The king gets
+# a large value so that king captures are tried after captures by any other attacker.
+_ORDERING_VALUES: Tuple[int, ...] = (1, 3, 3, 5, 9, 20) * 2
+# Ordering bands; history counters stay far below the killer band
+_KILLER_SCORE = 1 << 40
+_CAPTURE_SCORE = 1 << 41
+_TT_MOVE_SCORE = 1 << 42
+
+# Destination rank of promoting pawns, indexed by side
+_PROMOTION_RANK = (RANK_8, RANK_1)
+
+# Zobrist keys: one random 64-bit number per (piece, square) plus one for "black to move".
+# Seeded so that hashes are reproducible across runs.
+_zobrist_rng = random.Random(20251105)
+ZOBRIST: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(_zobrist_rng.getrandbits(64) for _ in range(64)) for _ in range(12)
+)
+ZOBRIST_SIDE: int = _zobrist_rng.getrandbits(64)
+del _zobrist_rng
+
+
+def pack_move(from_index: int, to_index: int, promotion_kind: int = 0) -> int:
+    """Pack a move into a single int: ``from | to << 6 | promotion_kind << 12``.
+
+    ``promotion_kind`` is the piece type offset within ``PIECE_SYMBOLS`` (1=N, 2=B, 3=R, 4=Q), or 0
+    when the move is not a promotion.
+    """
+
+    return from_index | (to_index << 6) | (promotion_kind << 12)
+
+
+def square_to_index(square: Square) -> int:
+    """Convert a (row, col) square to its LERF bitboard index (a1=0, h8=63)."""
+
+    row, col = square
+    return (7 - row) * 8 + col
+
+
+def index_to_square(index: int) -> Square:
+    """Convert a LERF bitboard index back to a (row, col) square."""
+
+    return 7 - (index >> 3), index & 7
+
+
+def _append_moves(from_index: int, targets: int, out: List[int]) -> None:
+    """Append a packed move from ``from_index`` to every square set in the ``targets`` bitboard."""
+
+    while targets:
+        low = targets & -targets
+        out.append(from_index | ((low.bit_length() - 1) << 6))
+        targets ^= low
+
+
+def _append_pawn_moves(targets: int, delta: int, out: List[int]) -> None:
+    """Append a pawn move to every square in ``targets`` from the square ``delta`` behind it.
+
+    Moves reaching the first or eighth rank are appended as four promotions (queen, rook, bishop,
+    knight).
+    """
+
+    promotions = targets & (RANK_1 | RANK_8)
+    targets ^= promotions
+    while targets:
+        low = targets & -targets
+        to_index = low.bit_length() - 1
+        out.append((to_index - delta) | (to_index << 6))
+        targets ^= low
+    while promotions:
+        low = promotions & -promotions
+        to_index = low.bit_length() - 1
+        move = (to_index - delta) | (to_index << 6)
+        out.extend((move | 0x4000, move | 0x3000, move | 0x2000, move | 0x1000))
+        promotions ^= low
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Snapshot of a cache's effectiveness, in the spirit of ``functools.lru_cache.cache_info``."""
+
+    hits: int
+    misses: int
+    size: int
+    maxsize: int
+
+
+class _CheckCache:
+    """Bounded LRU map from ``(zobrist, side)`` to an ``is_in_check`` answer, with hit counters."""
+
+    __slots__ = ("entries", "hits", "misses")
 
+    maxsize = 1 << 16
 
-@dataclass(frozen=True)
+    def __init__(self) -> None:
+        self.entries: OrderedDict[Tuple[int, int], bool] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+
+@dataclass(frozen=True, slots=True)
 class Move:
     """Represents a single chess move.
 
@@ -81,32 +215,126 @@ class Move:
             promotion = promo_char
         return Move(from_sq=from_sq, to_sq=to_sq, promotion=promotion)
 
+    def to_packed(self) -> int:
+        """Return the packed-int encoding used by move generation and search (see ``pack_move``)."""
+
+        kind = _PIECE_INDEX[self.promotion.upper()] if self.promotion else 0
+        return pack_move(square_to_index(self.from_sq), square_to_index(self.to_sq), kind)
+
+    @staticmethod
+    def from_packed(packed: int) -> "Move":
+        """Build a Move from its packed-int encoding."""
+
+        to_index = (packed >> 6) & 63
+        kind = packed >> 12
+        promotion: Optional[Piece] = None
+        if kind:
+            # Only white pawns promote on the eighth rank
+            promotion = PIECE_SYMBOLS[kind if to_index >= 56 else kind + 6]
+        return Move(index_to_square(packed & 63), index_to_square(to_index), promotion)
+
 
 class Board:
-    """Immutable representation of a chessboard position.
+    """Mutable representation of a chessboard position.
+
+    The board is stored as twelve 64-bit integer bitboards, one per piece type and color, in the
+    order given by ``PIECE_SYMBOLS``. Per-color occupancy masks and the combined occupancy are
+    cached alongside so move generation can work with plain bitwise operations, together with the
+    Zobrist hash of the position (``zobrist``) and the LERF square of each king (``king_sq``,
+    indexed 0=white, 1=black, -1 if the king is missing). ``psq_score`` is the material plus
+    piece-square evaluation from White's perspective, also updated incrementally. The side to move
+    is kept as an int in ``side`` (``WHITE`` or ``BLACK``); ``turn`` exposes it as a color name.
 
-    The board is stored as an 8x8 list of lists containing piece symbols or None.
+    ``make``/``unmake`` update the position in place and are what the search uses; ``apply_move``
+    returns an updated copy and leaves the original untouched.
 
     Uppercase pieces belong to white, lowercase pieces belong to black.
     """
 
-    def __init__(self, grid: Optional[List[List[Optional[Piece]]]] = None, turn: Color = "white") -> None:
-        if grid is None:
-            grid = [[None for _ in range(8)] for _ in range(8)]
-        # Deep copy to enforce immutability semantics
-        self._grid: List[List[Optional[Piece]]] = [[cell for cell in row] for row in grid]
-        self.turn: Color = turn
+    __slots__ = (
+        "bitboards",
+        "occupancy",
+        "all_occ",
+        "king_sq",
+        "side",
+        "zobrist",
+        "psq_score",
+        "_legal_cache",
+        "_check_cache",
+    )
+
+    def __init__(self, bitboards: Optional[List[int]] = None, turn: Color = "white") -> None:
+        if bitboards is None:
+            bitboards = [0] * 12
+        if len(bitboards) != 12:
+            raise ValueError(f"Expected 12 bitboards, got {len(bitboards)}")
+        self.bitboards: List[int] = list(bitboards)
+        white_occ = 0
+        black_occ = 0
+        for index in range(6):
+            white_occ |= self.bitboards[index]
+            black_occ |= self.bitboards[index + 6]
+        self.occupancy: List[int] = [white_occ, black_occ]
+        self.all_occ: int = white_occ | black_occ
+        self.king_sq: List[int] = [
+            self.bitboards[5].bit_length() - 1,
+            self.bitboards[11].bit_length() - 1,
+        ]
+        self.side: int = _COLOR_INDEX[turn]
+        self.zobrist: int = self._compute_zobrist()
+        self.psq_score: int = self._compute_psq_score()
+        # (zobrist, side, moves) of the last generate_legal_moves call
+        self._legal_cache: Optional[Tuple[int, int, Tuple[Move, ...]]] = None
+        # Answers of is_in_check for this board only, created on first use (clones start empty)
+        self._check_cache: Optional[_CheckCache] = None
+
+    @property
+    def turn(self) -> Color:
+        """Color name of the side to move."""
+
+        return COLOR_NAMES[self.side]
+
+    def _compute_zobrist(self) -> int:
+        """Compute the Zobrist hash of the position from scratch."""
+
+        key = ZOBRIST_SIDE if self.side == BLACK else 0
+        for piece_index, bb in enumerate(self.bitboards):
+            keys = ZOBRIST[piece_index]
+            while bb:
+                low = bb & -bb
+                key ^= keys[low.bit_length() - 1]
+                bb ^= low
+        return key
+
+    def _compute_psq_score(self) -> int:
+        """Sum the piece-square table entries of every piece on the board from scratch."""
+
+        score = 0
+        for table, bb in zip(PIECE_SQUARE_TABLES, self.bitboards):
+            while bb:
+                low = bb & -bb
+                score += table[low.bit_length() - 1]
+                bb ^= low
+        return score
 
     # -----------------------------------------------------------------------------------------------------------------
     # Construction helpers
     # -----------------------------------------------------------------------------------------------------------------
 
-    @staticmethod
-    def start_position() -> "Board":
-        """Return a Board initialized to the standard chess starting position."""
+    @classmethod
+    def start_position(cls) -> "Board":
+        """Return a Board initialized to the standard chess starting position.
 
-        fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w"
-        return Board.from_fen(fen)
+        The FEN is parsed only once; every call returns a fresh clone of that cached prototype.
+        """
+
+        return cls._start_prototype().clone()
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _start_prototype() -> "Board":
+        # Shared by all start_position() calls and never handed out, so it must not be mutated
+        return Board.from_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w")
 
     @staticmethod
     def from_fen(fen: str) -> "Board":
@@ -119,21 +347,23 @@ class Board:
         rows = board_part.split("/")
         if len(rows) != 8:
             raise ValueError(f"Invalid FEN (rows): {fen!r}")
-        grid: List[List[Optional[Piece]]] = []
-        for row_str in rows:
-            row: List[Optional[Piece]] = []
+        bitboards = [0] * 12
+        for row, row_str in enumerate(rows):
+            col = 0
             for ch in row_str:
                 if ch.isdigit():
-                    for _ in range(int(ch)):
-                        row.append(None)
-                else:
-                    row.append(ch)
-            if len(row) != 8:
+                    col += int(ch)
+                    continue
+                if ch not in _PIECE_INDEX:
+                    raise ValueError(f"Invalid FEN piece: {ch!r}")
+                if col < 8:
+                    bitboards[_PIECE_INDEX[ch]] |= 1 << square_to_index((row, col))
+                col += 1
+            if col != 8:
                 raise ValueError(f"Invalid FEN row: {row_str!r}")
-            grid.append(row)
 
         turn = "white" if turn_part == "w" else "black"
-        return Board(grid=grid, turn=turn)
+        return Board(bitboards=bitboards, turn=turn)
 
     def to_fen(self) -> str:
         """Export the board position to a minimal FEN string (board + side to move)."""
@@ -143,7 +373,7 @@ class Board:
             empty = 0
             row_str = ""
             for c in range(8):
-                piece = self._grid[r][c]
+                piece = self.piece_at((r, c))
                 if piece is None:
                     empty += 1
                 else:
@@ -155,7 +385,7 @@ class Board:
                 row_str += str(empty)
             rows.append(row_str)
         board_part = "/".join(rows)
-        turn_part = "w" if self.turn == "white" else "b"
+        turn_part = "wb"[self.side]
         return f"{board_part} {turn_part}"
 
     # -----------------------------------------------------------------------------------------------------------------
@@ -189,8 +419,18 @@ class Board:
     # -----------------------------------------------------------------------------------------------------------------
 
     def piece_at(self, square: Square) -> Optional[Piece]:
-        row, col = square
-        return self._grid[row][col]
+        piece_index = self.piece_index_at(square_to_index(square))
+        return PIECE_SYMBOLS[piece_index] if piece_index >= 0 else None
+
+    def piece_index_at(self, index: int) -> int:
+        """Return the bitboard index (0-11) of the piece on LERF square ``index``, or -1."""
+
+        if not (self.all_occ >> index) & 1:
+            return -1
+        for piece_index, mask in enumerate(self.bitboards):
+            if (mask >> index) & 1:
+                return piece_index
+        return -1
 
     def is_on_board(self, square: Square) -> bool:
         row, col = square
@@ -201,144 +441,214 @@ class Board:
     # -----------------------------------------------------------------------------------------------------------------
 
     def generate_legal_moves(self, color: Optional[Color] = None) -> List[Move]:
-        """Generate all legal moves for the given color (or the side to move if None)."""
+        """Generate all legal moves for the given color (or the side to move if None).
+
+        The result is remembered together with the Zobrist key, so asking again about an unchanged
+        position (as checkmate/stalemate detection and move validation do) costs only a list copy.
+        Positions reached with ``make`` have a different key and miss the cache automatically.
+        """
 
-        if color is None:
-            color = self.turn
+        side = self.side if color is None else _COLOR_INDEX[color]
+        cache = self._legal_cache
+        if cache is not None and cache[0] == self.zobrist and cache[1] == side:
+            return list(cache[2])
+        moves: List[int] = []
+        self.gen_legal_moves(side, moves)
+        legal = tuple(Move.from_packed(move) for move in moves)
+        self._legal_cache = (self.zobrist, side, legal)
+        return list(legal)
+
+    def generate_ordered_moves(
+        self, color: Optional[Color] = None, killers: Sequence[Move] = ()
+    ) -> List[Move]:
+        """Generate the legal moves of ``color`` in the order a search should try them.
+
+        Captures and promotions come first, by Most-Valuable-Victim / Least-Valuable-Attacker, then
+        up to two ``killers`` (quiet moves that refuted a sibling position), then the remaining
+        quiet moves in generation order.
+        """
 
-        legal_moves: List[Move] = []
-        for move in self._generate_pseudo_moves(color):
-            new_board = self.apply_move(move, switch_turn=False)
-            if not new_board.is_in_check(color):
-                legal_moves.append(move)
-        return legal_moves
+        side = self.side if color is None else _COLOR_INDEX[color]
+        moves: List[int] = []
+        self.gen_legal_moves(side, moves)
+        packed_killers = [killer.to_packed() for killer in killers[:2]] + [0, 0]
+        self.order_moves(moves, killers=(packed_killers[0], packed_killers[1]))
+        return [Move.from_packed(move) for move in moves]
+
+    def order_moves(
+        self,
+        moves: List[int],
+        tt_move: int = 0,
+        killers: Tuple[int, int] = (0, 0),
+        history: Optional[List[int]] = None,
+    ) -> None:
+        """Sort packed moves in place for alpha–beta search.
+
+        The transposition table move (if present) comes first, then captures and promotions sorted
+        by Most-Valuable-Victim / Least-Valuable-Attacker (``10 * victim - attacker``), then the
+        killer moves, then the remaining quiet moves by ``history`` score.
+        """
 
-    def _generate_pseudo_moves(self, color: Color) -> Iterable[Move]:
-        for row in range(8):
-            for col in range(8):
-                piece = self._grid[row][col]
-                if piece is None:
-                    continue
-                if color == "white" and not piece.isupper():
-                    continue
-                if color == "black" and not piece.islower():
-                    continue
-                yield from self._moves_for_piece((row, col), piece)
+        piece_index_at = self.piece_index_at
+        killer_1, killer_2 = killers
+
+        def score(move: int) -> int:
+            if move == tt_move:
+                return _TT_MOVE_SCORE
+            to_sq = (move >> 6) & 63
+            victim = piece_index_at(to_sq)
+            if victim < 0 and move < 4096:
+                if move == killer_1:
+                    return _KILLER_SCORE + 1
+                if move == killer_2:
+                    return _KILLER_SCORE
+                if history is None:
+                    return 0
+                return history[piece_index_at(move & 63) * 64 + to_sq]
+            value = _CAPTURE_SCORE - _ORDERING_VALUES[piece_index_at(move & 63)]
+            if victim >= 0:
+                value += 10 * _ORDERING_VALUES[victim]
+            if move >= 4096:
+                value += 10 * _ORDERING_VALUES[move >> 12]
+            return value
+
+        # list.sort is stable even with reverse=True, so ties keep generation order
+        moves.sort(key=score, reverse=True)
+
+    def gen_legal_moves(self, side: int, out: List[int], tactical_only: bool = False) -> None:
+        """Append the legal moves of ``side`` (``WHITE``/``BLACK``) to ``out`` as packed ints.
+
+        The caller owns ``out`` and may reuse it between calls. With ``tactical_only`` set, only
+        captures and promotions are generated, as needed by quiescence search.
+
+        Legality is decided without making any move. The pieces giving check and the pieces pinned
+        to the king are found once: pinned pieces may only move along their pin line, a single
+        check must be answered by capturing or blocking the checker (or moving the king), and a
+        double check leaves only king moves. King moves are tested against the occupancy with the
+        king removed, so the king cannot step back along the ray of a checking slider.
+        """
 
-    def _moves_for_piece(self, square: Square, piece: Piece) -> Iterable[Move]:
-        row, col = square
-        color = "white" if piece.isupper() else "black"
-        p = piece.upper()
-
-        if p == "P":
-            yield from self._pawn_moves(square, color)
-        elif p == "N":
-            yield from self._knight_moves(square, color)
-        elif p == "B":
-            yield from self._sliding_moves(square, color, directions=[(-1, -1), (-1, 1), (1, -1), (1, 1)])
-        elif p == "R":
-            yield from self._sliding_moves(square, color, directions=[(-1, 0), (1, 0), (0, -1), (0, 1)])
-        elif p == "Q":
-            yield from self._sliding_moves(
-                square,
-                color,
-                directions=[(-1, -1), (-1, 1), (1, -1), (1, 1), (-1, 0), (1, 0), (0, -1), (0, 1)],
-            )
-        elif p == "K":
-            yield from self._king_moves(square, color)
-        else:
+        king = self.king_sq[side]
+        if king < 0:
+            # Without a king there is nothing to keep safe, so no move counts as legal
             return
-
-    def _pawn_moves(self, square: Square, color: Color) -> Iterable[Move]:
-        row, col = square
-        direction = -1 if color == "white" else 1
-        start_row = 6 if color == "white" else 1
-        promotion_row = 0 if color == "white" else 7
-
-        # Single step forward
-        forward = (row + direction, col)
-        if self.is_on_board(forward) and self.piece_at(forward) is None:
-            if forward[0] == promotion_row:
-                for promo in ("Q", "R", "B", "N"):
-                    piece = promo if color == "white" else promo.lower()
-                    yield Move(square, forward, promotion=piece)
+        enemy = side ^ 1
+        offset = 6 * side
+        enemy_offset = 6 * enemy
+        bitboards = self.bitboards
+        own_occ = self.occupancy[side]
+        enemy_occ = self.occupancy[enemy]
+        occ = self.all_occ
+
+        checkers = self.attackers_to(king, enemy, occ)
+        if not checkers & (checkers - 1):
+            # Not in double check: other pieces may capture or block a checker (if any)
+            evasion = BETWEEN[king][checkers.bit_length() - 1] | checkers if checkers else BB_MASK
+            if tactical_only:
+                piece_mask = evasion & enemy_occ
+                pawn_mask = evasion & (enemy_occ | _PROMOTION_RANK[side])
             else:
-                yield Move(square, forward)
-
-            # Double step from starting rank
-            double = (row + 2 * direction, col)
-            if row == start_row and self.piece_at(double) is None and self.piece_at(forward) is None:
-                yield Move(square, double)
-
-        # Captures
-        for dc in (-1, 1):
-            target = (row + direction, col + dc)
-            if not self.is_on_board(target):
-                continue
-            target_piece = self.piece_at(target)
-            if target_piece is None:
-                continue
-            if color == "white" and target_piece.islower() or color == "black" and target_piece.isupper():
-                if target[0] == promotion_row:
-                    for promo in ("Q", "R", "B", "N"):
-                        piece = promo if color == "white" else promo.lower()
-                        yield Move(square, target, promotion=piece)
-                else:
-                    yield Move(square, target)
+                piece_mask = evasion & ~own_occ
+                pawn_mask = evasion
 
-    def _knight_moves(self, square: Square, color: Color) -> Iterable[Move]:
-        row, col = square
-        deltas = [
-            (-2, -1),
-            (-2, 1),
-            (-1, -2),
-            (-1, 2),
-            (1, -2),
-            (1, 2),
-            (2, -1),
-            (2, 1),
-        ]
-        for dr, dc in deltas:
-            target = (row + dr, col + dc)
-            if not self.is_on_board(target):
-                continue
-            piece = self.piece_at(target)
-            if piece is None or (color == "white" and piece.islower()) or (color == "black" and piece.isupper()):
-                yield Move(square, target)
-
-    def _sliding_moves(self, square: Square, color: Color, directions: Iterable[Tuple[int, int]]) -> Iterable[Move]:
-        row, col = square
-        for dr, dc in directions:
-            r, c = row + dr, col + dc
-            while 0 <= r < 8 and 0 <= c < 8:
-                piece = self._grid[r][c]
-                target = (r, c)
-                if piece is None:
-                    yield Move(square, target)
-                else:
-                    if (color == "white" and piece.islower()) or (color == "black" and piece.isupper()):
-                        yield Move(square, target)
-                    break
-                r += dr
-                c += dc
+            # Absolutely pinned pieces: a single own piece between the king and an enemy slider
+            enemy_queens = bitboards[enemy_offset + 4]
+            snipers = (rook_attacks(king, 0) & (bitboards[enemy_offset + 3] | enemy_queens)) | (
+                bishop_attacks(king, 0) & (bitboards[enemy_offset + 2] | enemy_queens)
+            )
+            pinned = 0
+            while snipers:
+                low = snipers & -snipers
+                snipers ^= low
+                blockers = BETWEEN[king][low.bit_length() - 1] & occ
+                if blockers & own_occ and not blockers & (blockers - 1):
+                    pinned |= blockers
+
+            pawn_moves = self._white_pawn_moves if side == WHITE else self._black_pawn_moves
+            pawns = bitboards[offset]
+            pawn_moves(pawns & ~pinned, pawn_mask, out)
+            bb = pawns & pinned
+            while bb:
+                low = bb & -bb
+                pawn_moves(low, pawn_mask & LINE[king][low.bit_length() - 1], out)
+                bb ^= low
+
+            # A pinned knight can never stay on its pin line
+            bb = bitboards[offset + 1] & ~pinned
+            while bb:
+                low = bb & -bb
+                sq = low.bit_length() - 1
+                _append_moves(sq, KNIGHT_ATTACKS[sq] & piece_mask, out)
+                bb ^= low
+
+            for kind, attacks in ((2, bishop_attacks), (3, rook_attacks), (4, queen_attacks)):
+                bb = bitboards[offset + kind]
+                while bb:
+                    low = bb & -bb
+                    sq = low.bit_length() - 1
+                    targets = attacks(sq, occ) & piece_mask
+                    if pinned & low:
+                        targets &= LINE[king][sq]
+                    _append_moves(sq, targets, out)
+                    bb ^= low
+
+        targets = KING_ATTACKS[king] & (enemy_occ if tactical_only else ~own_occ)
+        attackers_to = self.attackers_to
+        occ_without_king = occ ^ (1 << king)
+        while targets:
+            low = targets & -targets
+            to_sq = low.bit_length() - 1
+            if not attackers_to(to_sq, enemy, occ_without_king):
+                out.append(king | (to_sq << 6))
+            targets ^= low
+
+    def _white_pawn_moves(self, pawns: int, mask: int, out: List[int]) -> None:
+        """Append the moves of the white ``pawns`` whose destination lies in ``mask``.
+
+        Each kind of pawn move is computed for all pawns at once with a single shift of the pawn
+        bitboard; only the resulting destinations are iterated.
+        """
 
-    def _king_moves(self, square: Square, color: Color) -> Iterable[Move]:
-        row, col = square
-        for dr in (-1, 0, 1):
-            for dc in (-1, 0, 1):
-                if dr == 0 and dc == 0:
-                    continue
-                target = (row + dr, col + dc)
-                if not self.is_on_board(target):
-                    continue
-                piece = self.piece_at(target)
-                if piece is None or (color == "white" and piece.islower()) or (color == "black" and piece.isupper()):
-                    yield Move(square, target)
+        empty = ~self.all_occ & BB_MASK
+        enemy_occ = self.occupancy[BLACK] & mask
+        single = (pawns << 8) & empty
+        double = ((single & RANK_3) << 8) & empty & mask
+        _append_pawn_moves(single & mask, 8, out)
+        _append_pawn_moves(double, 16, out)
+        _append_pawn_moves(((pawns & ~FILE_A) << 7) & enemy_occ, 7, out)
+        _append_pawn_moves(((pawns & ~FILE_H) << 9) & enemy_occ, 9, out)
+
+    def _black_pawn_moves(self, pawns: int, mask: int, out: List[int]) -> None:
+        """Append the moves of the black ``pawns`` whose destination lies in ``mask``."""
+
+        empty = ~self.all_occ & BB_MASK
+        enemy_occ = self.occupancy[WHITE] & mask
+        single = (pawns >> 8) & empty
+        double = ((single & RANK_6) >> 8) & empty & mask
+        _append_pawn_moves(single & mask, -8, out)
+        _append_pawn_moves(double, -16, out)
+        _append_pawn_moves(((pawns & ~FILE_A) >> 9) & enemy_occ, -9, out)
+        _append_pawn_moves(((pawns & ~FILE_H) >> 7) & enemy_occ, -7, out)
 
     # -----------------------------------------------------------------------------------------------------------------
     # Game status and move application
     # -----------------------------------------------------------------------------------------------------------------
 
+    def clone(self) -> "Board":
+        """Return an independent copy of this board."""
+
+        board = Board.__new__(Board)
+        board.bitboards = list(self.bitboards)
+        board.occupancy = list(self.occupancy)
+        board.all_occ = self.all_occ
+        board.king_sq = list(self.king_sq)
+        board.side = self.side
+        board.zobrist = self.zobrist
+        board.psq_score = self.psq_score
+        board._legal_cache = self._legal_cache
+        board._check_cache = None
+        return board
+
     def apply_move(self, move: Move, switch_turn: bool = True) -> "Board":
         """Return a new Board with the given move applied.
 
@@ -348,39 +658,170 @@ class Board:
                 legality, this may be disabled.
         """
 
-        new_grid = [[cell for cell in row] for row in self._grid]
-        from_row, from_col = move.from_sq
-        to_row, to_col = move.to_sq
-        piece = new_grid[from_row][from_col]
-        new_grid[from_row][from_col] = None
-
-        if move.promotion is not None:
-            piece = move.promotion
-
-        new_grid[to_row][to_col] = piece
-        next_turn = self.opposite(self.turn) if switch_turn else self.turn
-        return Board(grid=new_grid, turn=next_turn)
+        child = self.clone()
+        child.make(move.to_packed())
+        if not switch_turn:
+            child.side = self.side
+            child.zobrist ^= ZOBRIST_SIDE
+        return child
+
+    def make(self, move: int) -> UndoInfo:
+        """Apply a packed ``move`` in place, toggle the side to move and return the undo info."""
+
+        from_index = move & 63
+        to_index = (move >> 6) & 63
+        from_bit = 1 << from_index
+        to_bit = 1 << to_index
+        bitboards = self.bitboards
+        occupancy = self.occupancy
+        undo_zobrist = key = self.zobrist
+        undo_psq = psq = self.psq_score
+        psq_tables = PIECE_SQUARE_TABLES
+
+        mover = 0 if occupancy[0] & from_bit else 1
+        offset = 6 * mover
+        captured = -1
+        if occupancy[mover ^ 1] & to_bit:
+            enemy_offset = 6 - offset
+            for captured in range(enemy_offset, enemy_offset + 6):
+                if bitboards[captured] & to_bit:
+                    break
+            bitboards[captured] ^= to_bit
+            key ^= ZOBRIST[captured][to_index]
+            psq -= psq_tables[captured][to_index]
+            occupancy[mover ^ 1] ^= to_bit
+            if captured == 11 - offset:
+                # Only reachable from illegal positions, but keep king_sq consistent
+                self.king_sq[mover ^ 1] = -1
+
+        piece_index = placed = -1
+        if occupancy[mover] & from_bit:
+            for piece_index in range(offset, offset + 6):
+                if bitboards[piece_index] & from_bit:
+                    break
+            placed = piece_index if move < 4096 else offset + (move >> 12)
+            bitboards[piece_index] ^= from_bit
+            bitboards[placed] |= to_bit
+            key ^= ZOBRIST[piece_index][from_index] ^ ZOBRIST[placed][to_index]
+            psq += psq_tables[placed][to_index] - psq_tables[piece_index][from_index]
+            occupancy[mover] ^= from_bit | to_bit
+            if piece_index == offset + 5:
+                self.king_sq[mover] = to_index
+
+        self.all_occ = occupancy[0] | occupancy[1]
+        self.side ^= 1
+        self.zobrist = key ^ ZOBRIST_SIDE
+        self.psq_score = psq
+        return piece_index, placed, captured, from_index, to_index, undo_zobrist, undo_psq
+
+    def unmake(self, undo: UndoInfo) -> None:
+        """Revert a move previously applied with ``make``."""
+
+        piece_index, placed, captured, from_index, to_index, undo_zobrist, undo_psq = undo
+        bitboards = self.bitboards
+        occupancy = self.occupancy
+        to_bit = 1 << to_index
+        if piece_index >= 0:
+            mover = 0 if piece_index < 6 else 1
+            bitboards[placed] ^= to_bit
+            bitboards[piece_index] |= 1 << from_index
+            occupancy[mover] ^= (1 << from_index) | to_bit
+            if piece_index == 6 * mover + 5:
+                self.king_sq[mover] = from_index
+        if captured >= 0:
+            bitboards[captured] |= to_bit
+            occupancy[0 if captured < 6 else 1] |= to_bit
+            if captured == 5 or captured == 11:
+                self.king_sq[0 if captured == 5 else 1] = to_index
+        self.all_occ = occupancy[0] | occupancy[1]
+        self.side ^= 1
+        self.zobrist = undo_zobrist
+        self.psq_score = undo_psq
 
     def _find_king(self, color: Color) -> Optional[Square]:
-        king_symbol = "K" if color == "white" else "k"
-        for row in range(8):
-            for col in range(8):
-                if self._grid[row][col] == king_symbol:
-                    return row, col
-        return None
+        king_sq = self.king_sq[_COLOR_INDEX[color]]
+        return index_to_square(king_sq) if king_sq >= 0 else None
 
     def is_in_check(self, color: Color) -> bool:
-        """Return True if the king of the given color is in check."""
+        """Return True if the king of the given color is in check.
 
-        king_sq = self._find_king(color)
-        if king_sq is None:
+        Answers are remembered per position in a bounded LRU cache owned by this board, so the
+        repeated checks made by game-status detection cost a dictionary lookup. The search calls
+        ``in_check`` directly: there nearly every position is new, and computing the attack test is
+        cheaper than maintaining the cache.
+        """
+
+        side = _COLOR_INDEX[color]
+        cache = self._check_cache
+        if cache is None:
+            cache = self._check_cache = _CheckCache()
+        entries = cache.entries
+        key = (self.zobrist, side)
+        result = entries.get(key)
+        if result is not None:
+            cache.hits += 1
+            entries.move_to_end(key)
+            return result
+        cache.misses += 1
+        result = entries[key] = self.in_check(side)
+        if len(entries) > cache.maxsize:
+            entries.popitem(last=False)
+        return result
+
+    def check_cache_info(self) -> CacheStats:
+        """Return hit/miss statistics of the ``is_in_check`` cache."""
+
+        cache = self._check_cache
+        if cache is None:
+            return CacheStats(0, 0, 0, _CheckCache.maxsize)
+        return CacheStats(cache.hits, cache.misses, len(cache.entries), cache.maxsize)
+
+    def in_check(self, side: int) -> bool:
+        """Return True if the king of ``side`` (``WHITE``/``BLACK``) is in check."""
+
+        king_sq = self.king_sq[side]
+        if king_sq < 0:
             # No king found; treat as check for safety
             return True
-        opponent = self.opposite(color)
-        for move in self._generate_pseudo_moves(opponent):
-            if move.to_sq == king_sq:
-                return True
-        return False
+        return self.attacked_by(king_sq, side ^ 1)
+
+    def attacked_by(self, sq: int, by_side: int) -> bool:
+        """Return True if LERF square ``sq`` is attacked by any piece of ``by_side``.
+
+        Works outward from the target square: a piece of type X attacks ``sq`` exactly when an X
+        standing on ``sq`` would attack it, so each piece type costs a single table lookup and AND.
+        This is ``attackers_to`` with early exits, kept separate because ``in_check`` calls it at
+        every search node and returning at the first attacker is noticeably faster.
+        """
+
+        offset = 6 * by_side
+        bitboards = self.bitboards
+        if KNIGHT_ATTACKS[sq] & bitboards[offset + 1]:
+            return True
+        if KING_ATTACKS[sq] & bitboards[offset + 5]:
+            return True
+        # Pawns of `by_side` attacking sq sit where a pawn of the other color on sq would attack
+        if PAWN_ATTACKS[by_side ^ 1][sq] & bitboards[offset]:
+            return True
+        queens = bitboards[offset + 4]
+        occ = self.all_occ
+        if bishop_attacks(sq, occ) & (bitboards[offset + 2] | queens):
+            return True
+        return bool(rook_attacks(sq, occ) & (bitboards[offset + 3] | queens))
+
+    def attackers_to(self, sq: int, by_side: int, occ: int) -> int:
+        """Return the pieces of ``by_side`` attacking ``sq``, with sliders blocked by ``occ``."""
+
+        offset = 6 * by_side
+        bitboards = self.bitboards
+        queens = bitboards[offset + 4]
+        return (
+            (KNIGHT_ATTACKS[sq] & bitboards[offset + 1])
+            | (KING_ATTACKS[sq] & bitboards[offset + 5])
+            | (PAWN_ATTACKS[by_side ^ 1][sq] & bitboards[offset])
+            | (bishop_attacks(sq, occ) & (bitboards[offset + 2] | queens))
+            | (rook_attacks(sq, occ) & (bitboards[offset + 3] | queens))
+        )
 
     def is_checkmate(self, color: Color) -> bool:
         return self.is_in_check(color) and len(self.generate_legal_moves(color)) == 0
@@ -400,7 +841,7 @@ class Board:
             rank = 8 - row
             row_pieces: List[str] = []
             for col in range(8):
-                piece = self._grid[row][col]
+                piece = self.piece_at((row, col))
                 row_pieces.append(piece if piece is not None else ".")
             lines.append(f"{rank}  {' '.join(row_pieces)}")
         lines.append("   a b c d e f g h")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=================================================================================================================
+Project: Game of Chess AI
+File: evaluation.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-15
+Updated: 2026-10-15
+License: MIT License (see LICENSE file for details)
+=
+
+Description:
+Static evaluation data: material values and piece-square tables, all in integer centipawns. The
+tables are combined into ``PIECE_SQUARE_TABLES``, which ``Board`` uses to keep a running evaluation
+of the position as moves are made and unmade.
+
+Usage:
+from chess_ai.evaluation import PIECE_SQUARE_TABLES
+
+score = PIECE_SQUARE_TABLES[piece_index][sq]
+
+Notes:
+- Scores are from White's perspective: White pieces count positive, Black pieces negative.
+- This module has no dependencies on the rest of the package, so ``board.py`` can import it.
+=================================================================================================================
+"""
+
+from __future__ import annotations
+
+from typing import List, Tuple
+
+# Material values (in centipawns)
+PIECE_VALUES = {
+    "P": 100,
+    "N": 300,
+    "B": 325,
+    "R": 500,
+    "Q": 900,
+    "K": 0,  # King's value is implicit; losing it is game over
+}
+
+# Piece-square bonuses in centipawns from White's point of view, laid out as the board is printed:
+# the first row is rank 8 and the last row is rank 1.
+# fmt: off
+_PAWN_TABLE = (
+      0,   0,   0,   0,   0,   0,   0,   0,
+     50,  50,  50,  50,  50,  50,  50,  50,
+     10,  10,  20,  30,  30,  20,  10,  10,
+      5,   5,  10,  25,  25,  10,   5,   5,
+      0,   0,   0,  20,  20,   0,   0,   0,
+      5,  -5, -10,   0,   0, -10,  -5,   5,
+      5,  10,  10, -20, -20,  10,  10,   5,
+      0,   0,   0,   0,   0,   0,   0,   0,
+)
+_KNIGHT_TABLE = (
+    -50, -40, -30, -30, -30, -30, -40, -50,
+    -40, -20,   0,   0,   0,   0, -20, -40,
+    -30,   0,  10,  15,  15,  10,   0, -30,
+    -30,   5,  15,  20,  20,  15,   5, -30,
+    -30,   0,  15,  20,  20,  15,   0, -30,
+    -30,   5,  10,  15,  15,  10,   5, -30,
+    -40, -20,   0,   5,   5,   0, -20, -40,
+    -50, -40, -30, -30, -30, -30, -40, -50,
+)
+_BISHOP_TABLE = (
+    -20, -10, -10, -10, -10, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,  10,  10,   5,   0, -10,
+    -10,   5,   5,  10,  10,   5,   5, -10,
+    -10,   0,  10,  10,  10,  10,   0, -10,
+    -10,  10,  10,  10,  10,  10,  10, -10,
+    -10,   5,   0,   0,   0,   0,   5, -10,
+    -20, -10, -10, -10, -10, -10, -10, -20,
+)
+_ROOK_TABLE = (
+      0,   0,   0,   0,   0,   0,   0,   0,
+      5,  10,  10,  10,  10,  10,  10,   5,
+     -5,   0,   0,   0,   0,   0,   0,  -5,
+     -5,   0,   0,   0,   0,   0,   0,  -5,
+     -5,   0,   0,   0,   0,   0,   0,  -5,
+     -5,   0,   0,   0,   0,   0,   0,  -5,
+     -5,   0,   0,   0,   0,   0,   0,  -5,
+      0,   0,   0,   5,   5,   0,   0,   0,
+)
+_QUEEN_TABLE = (
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,   5,   5,   5,   0, -10,
+     -5,   0,   5,   5,   5,   5,   0,  -5,
+      0,   0,   5,   5,   5,   5,   0,  -5,
+    -10,   5,   5,   5,   5,   5,   0, -10,
+    -10,   0,   5,   0,   0,   0,   0, -10,
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+)
+_KING_TABLE = (
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -20, -30, -30, -40, -40, -30, -30, -20,
+    -10, -20, -20, -20, -20, -20, -20, -10,
+     20,  20,   0,   0,   0,   0,  20,  20,
+     20,  30,  10,   0,   0,  10,  30,  20,
+)
+# fmt: on
+
+
+def _build_piece_square_tables() -> Tuple[Tuple[int, ...], ...]:
+    """Return, per bitboard index, the signed centipawn value of that piece on each square.
+
+    Material and the positional bonus are folded into a single number, positive for White pieces
+    and negative for Black pieces. Black uses the White table mirrored vertically (``sq ^ 56``), so
+    symmetric positions evaluate to exactly zero.
+    """
+
+    tables = (_PAWN_TABLE, _KNIGHT_TABLE, _BISHOP_TABLE, _ROOK_TABLE, _QUEEN_TABLE, _KING_TABLE)
+    white: List[Tuple[int, ...]] = []
+    black: List[Tuple[int, ...]] = []
+    for symbol, table in zip("PNBRQK", tables):
+        value = PIECE_VALUES[symbol]
+        # Printed row 0 is rank 8, so LERF square sq sits at printed index sq ^ 56 for White
+        white.append(tuple(value + table[sq ^ 56] for sq in range(64)))
+        black.append(tuple(-(value + table[sq]) for sq in range(64)))
+    return tuple(white + black)
+
+
+# Indexed by bitboard index (0-11), then by LERF square
+PIECE_SQUARE_TABLES = _build_piece_square_tables()
\ No newline at end of file
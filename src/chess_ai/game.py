@@ -35,7 +35,7 @@ from .ai import SearchResult, find_best_move
 from .board import Board, Color, Move
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GameResult:
     winner: Optional[Color]  # "white", "black", or None for draw
     reason: str
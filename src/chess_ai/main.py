@@ -6,7 +6,7 @@ Project: Game of Chess AI
 File: main.py
 Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
 Created: 2025-11-05
-Updated: 2025-11-05
+Updated: 2026-10-15
 License: MIT License (see LICENSE file for details)
 =
 
@@ -96,7 +96,7 @@ Commands:
             engine_move = search_result.move
             print(
                 f"Engine plays: {engine_move.to_long_algebraic()} "
-                f"(score={search_result.score:.2f} from {side_to_move}'s perspective)\n"
+                f"(score={search_result.score / 100:.2f} from {side_to_move}'s perspective)\n"
             )
             game.apply_move(engine_move)
 
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=================================================================================================================
+Project: Game of Chess AI
+File: conftest.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-15
+Updated: 2026-10-15
+License: MIT License (see LICENSE file for details)
+=
+
+Description:
+Shared pytest fixtures. The standard starting position is built once per test session and every
+test receives its own clone, so tests may freely mutate the board they are given.
+
+Usage:
+def test_something(start_board: Board) -> None: ...
+=================================================================================================================
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from chess_ai.board import Board
+
+
+@pytest.fixture(scope="session")
+def start_board_proto() -> Board:
+    return Board.start_position()
+
+
+@pytest.fixture
+def start_board(start_board_proto: Board) -> Board:
+    return start_board_proto.clone()
\ No newline at end of file
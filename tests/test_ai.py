@@ -6,7 +6,7 @@ Project: Game of Chess AI
 File: test_ai.py
 Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
 Created: 2025-11-05
-Updated: 2025-11-05
+Updated: 2026-10-15
 License: MIT License (see LICENSE file for details)
 =
 
@@ -21,24 +21,67 @@ pytest tests/test_ai.py
 
 from __future__ import annotations
 
-from chess_ai.ai import SearchResult, evaluate_board, find_best_move
+from chess_ai.ai import SearchConfig, SearchResult, evaluate_board, find_best_move
 from chess_ai.board import Board
 
 
-def test_ai_returns_a_move_in_start_position() -> None:
-    board = Board.start_position()
-    result: SearchResult = find_best_move(board, max_depth=2)
+def test_ai_returns_a_move_in_start_position(start_board: Board) -> None:
+    result: SearchResult = find_best_move(start_board, max_depth=2)
     assert result.move is not None
 
 
-def test_evaluation_symmetry_for_start_position() -> None:
-    board = Board.start_position()
-    score = evaluate_board(board)
-    assert score == 0.0
+def test_tt_hits_on_start_position(start_board: Board) -> None:
+    result = find_best_move(start_board, max_depth=3)
+    assert result.tt_hits > 0
+
+
+def test_ai_finds_back_rank_mate_for_black() -> None:
+    board = Board.from_fen("3r2k1/8/8/8/8/8/5PPP/6K1 b")
+    result = find_best_move(board, max_depth=3)
+    assert result.move is not None
+    assert result.move.to_long_algebraic() == "d8d1"
+
+
+def test_lazy_smp_search_finds_back_rank_mate() -> None:
+    board = Board.from_fen("3r2k1/8/8/8/8/8/5PPP/6K1 b")
+    result = find_best_move(board, max_depth=3, threads=3)
+    assert result.move is not None
+    assert result.move.to_long_algebraic() == "d8d1"
+
+
+def test_move_ordering_reduces_nodes() -> None:
+    # One move before fool's mate: black mates with Qh4
+    board = Board.from_fen("rnbqkbnr/pppp1ppp/8/4p3/6P1/5P2/PPPPP2P/RNBQKBNR b")
+    ordered = find_best_move(board, max_depth=3)
+    unordered = find_best_move(board, max_depth=3, search_config=SearchConfig(move_ordering=False))
+    assert ordered.move is not None and ordered.move.to_long_algebraic() == "d8h4"
+    assert ordered.nodes < unordered.nodes
+
+
+def test_unordered_search_of_tactical_position_finishes() -> None:
+    # Kiwipete is full of captures; quiescence must stay ordered even with move_ordering off
+    board = Board.from_fen("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w")
+    result = find_best_move(board, max_depth=1, search_config=SearchConfig(move_ordering=False))
+    assert result.move is not None
+
+
+def test_horizon_nodes_are_counted_once(start_board: Board) -> None:
+    # At depth 1 each of the 20 replies is a single quiescence node (no captures are available)
+    result = find_best_move(start_board, max_depth=1)
+    assert result.nodes == 20
+
+
+def test_evaluation_symmetry_for_start_position(start_board: Board) -> None:
+    score = evaluate_board(start_board)
+    assert score == 0
 
 
 def test_simple_checkmate_detection() -> None:
     # Fool's mate position — black to move and already delivered checkmate
     fen = "rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w"
     board = Board.from_fen(fen)
-    assert board.is_in_check("white")
\ No newline at end of file
+    assert board.is_in_check("white")
+    assert board.is_checkmate("white")
+    # The second check of the same position is answered from the cache
+    stats = board.check_cache_info()
+    assert (stats.hits, stats.misses) == (1, 1)
\ No newline at end of file
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=================================================================================================================
+Project: Game of Chess AI
+File: test_bitboards.py
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
+Created: 2026-10-15
+Updated: 2026-10-15
+License: MIT License (see LICENSE file for details)
+=
+
+Description:
+Tests for the precomputed bitboard attack tables, checking the magic bitboard lookups against a
+straightforward ray-walking reference implementation.
+
+Usage:
+pytest tests/test_bitboards.py
+=================================================================================================================
+"""
+
+from __future__ import annotations
+
+import random
+
+from chess_ai import bitboards
+from chess_ai.bitboards import (
+    BETWEEN,
+    KING_ATTACKS,
+    KNIGHT_ATTACKS,
+    LINE,
+    bishop_attacks,
+    rook_attacks,
+)
+
+
+def test_step_attack_counts() -> None:
+    # Corner knight (a1) reaches 2 squares, central knight (d4) reaches 8; corner king reaches 3
+    assert KNIGHT_ATTACKS[0].bit_count() == 2
+    assert KNIGHT_ATTACKS[27].bit_count() == 8
+    assert KING_ATTACKS[0].bit_count() == 3
+
+
+def test_magic_attacks_match_ray_walk() -> None:
+    rng = random.Random(7)
+    for _ in range(2000):
+        sq = rng.randrange(64)
+        occupancy = rng.getrandbits(64) & rng.getrandbits(64)
+        assert rook_attacks(sq, occupancy) == bitboards._ray_attacks(
+            sq, occupancy, bitboards._ROOK_DIRECTIONS
+        )
+        assert bishop_attacks(sq, occupancy) == bitboards._ray_attacks(
+            sq, occupancy, bitboards._BISHOP_DIRECTIONS
+        )
+
+
+def test_between_and_line_tables() -> None:
+    a1, c3, h8, b3 = 0, 18, 63, 17
+    assert BETWEEN[a1][h8] == BETWEEN[h8][a1] == sum(1 << (9 * i) for i in range(1, 7))
+    assert BETWEEN[a1][c3] == 1 << 9
+    assert LINE[c3][h8] == LINE[a1][h8] and LINE[a1][h8].bit_count() == 8
+    # Squares that share no rank, file or diagonal have neither
+    assert BETWEEN[a1][b3] == LINE[a1][b3] == 0
\ No newline at end of file
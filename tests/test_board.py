@@ -6,7 +6,7 @@ Project: Game of Chess AI
 File: test_board.py
 Author: Mobin Yousefi (GitHub: github.com/mobinyousefi-cs)
 Created: 2025-11-05
-Updated: 2025-11-05
+Updated: 2026-10-15
 License: MIT License (see LICENSE file for details)
 =
 
@@ -21,33 +21,220 @@ pytest tests/test_board.py
 
 from __future__ import annotations
 
-from chess_ai.board import Board
+import random
+from typing import List, Set
 
+from chess_ai.bitboards import (
+    BB_MASK,
+    KING_ATTACKS,
+    KNIGHT_ATTACKS,
+    bishop_attacks,
+    queen_attacks,
+    rook_attacks,
+)
+from chess_ai.board import WHITE, Board
 
-def test_start_position_fen_roundtrip() -> None:
-    board = Board.start_position()
-    fen = board.to_fen()
+
+def _legal(board: Board, side: int, tactical_only: bool = False) -> List[int]:
+    moves: List[int] = []
+    board.gen_legal_moves(side, moves, tactical_only)
+    return moves
+
+
+def _pseudo_moves(board: Board, side: int) -> List[int]:
+    """Every pseudo-legal move of ``side``, including those that leave its own king in check."""
+
+    moves: List[int] = []
+    offset = 6 * side
+    if side == WHITE:
+        board._white_pawn_moves(board.bitboards[offset], BB_MASK, moves)
+    else:
+        board._black_pawn_moves(board.bitboards[offset], BB_MASK, moves)
+    not_own = ~board.occupancy[side]
+    piece_attacks = (
+        (1, lambda sq: KNIGHT_ATTACKS[sq]),
+        (2, lambda sq: bishop_attacks(sq, board.all_occ)),
+        (3, lambda sq: rook_attacks(sq, board.all_occ)),
+        (4, lambda sq: queen_attacks(sq, board.all_occ)),
+        (5, lambda sq: KING_ATTACKS[sq]),
+    )
+    for kind, attacks in piece_attacks:
+        for sq in range(64):
+            if not (board.bitboards[offset + kind] >> sq) & 1:
+                continue
+            targets = attacks(sq) & not_own
+            moves.extend(sq | (to << 6) for to in range(64) if (targets >> to) & 1)
+    return moves
+
+
+def _move_strings(board: Board, from_square: str = "") -> Set[str]:
+    return {
+        move.to_long_algebraic()
+        for move in board.generate_legal_moves()
+        if not from_square or Board.square_to_str(move.from_sq) == from_square
+    }
+
+
+def _perft(board: Board, depth: int) -> int:
+    moves = _legal(board, board.side)
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        undo = board.make(move)
+        nodes += _perft(board, depth - 1)
+        board.unmake(undo)
+    return nodes
+
+
+def test_start_position_fen_roundtrip(start_board: Board) -> None:
+    fen = start_board.to_fen()
     board2 = Board.from_fen(fen)
     assert board2.to_fen() == fen
 
 
-def test_start_position_side_to_move() -> None:
-    board = Board.start_position()
-    assert board.turn == "white"
+def test_start_position_side_to_move(start_board: Board) -> None:
+    assert start_board.turn == "white"
 
 
-def test_start_position_legal_moves_white_has_20() -> None:
-    board = Board.start_position()
-    moves = board.generate_legal_moves("white")
+def test_start_position_legal_moves_white_has_20(start_board: Board) -> None:
+    moves = start_board.generate_legal_moves("white")
     # In a standard chess starting position, White has 20 legal moves
     assert len(moves) == 20
 
 
-def test_simple_pawn_push() -> None:
-    board = Board.start_position()
+def test_simple_pawn_push(start_board: Board) -> None:
     # e2e4 should be legal
     from chess_ai.board import Move
 
     move = Move.from_long_algebraic("e2e4")
-    legal_moves = board.generate_legal_moves("white")
-    assert any(m.from_sq == move.from_sq and m.to_sq == move.to_sq for m in legal_moves)
\ No newline at end of file
+    legal_moves = start_board.generate_legal_moves("white")
+    assert any(m.from_sq == move.from_sq and m.to_sq == move.to_sq for m in legal_moves)
+
+
+def test_zobrist_hash_is_updated_incrementally() -> None:
+    from chess_ai.board import Move
+
+    board = Board.start_position()
+    for move_str in ("e2e4", "d7d5", "e4d5", "d8d5"):
+        board = board.apply_move(Move.from_long_algebraic(move_str))
+        assert board.zobrist == Board.from_fen(board.to_fen()).zobrist
+        assert board.psq_score == Board.from_fen(board.to_fen()).psq_score
+
+
+def test_make_unmake_restores_position() -> None:
+    # Covers plain promotions (b7b8) as well as capture-promotions (b7xa8, b7xc8)
+    board = Board.from_fen("r1b1k3/1P6/8/8/8/8/8/4K2R w")
+    fen, key = board.to_fen(), board.zobrist
+    for move in board.generate_legal_moves("white"):
+        undo = board.make(move.to_packed())
+        assert board.turn == "black"
+        assert board.king_sq == Board.from_fen(board.to_fen()).king_sq
+        board.unmake(undo)
+        assert board.to_fen() == fen
+        assert board.zobrist == key
+        assert board.king_sq == [4, 60]
+
+
+def test_pinned_piece_moves_only_along_pin_line() -> None:
+    # The white rook on e2 is pinned by the black rook on e8 and may only slide along the e-file
+    board = Board.from_fen("4r1k1/8/8/8/8/8/4R3/4K3 w")
+    rook_moves = {
+        move.to_long_algebraic()
+        for move in board.generate_legal_moves("white")
+        if move.from_sq == Board.str_to_square("e2")
+    }
+    assert rook_moves == {"e2e3", "e2e4", "e2e5", "e2e6", "e2e7", "e2e8"}
+
+
+def test_pinned_pawn_may_only_capture_its_pinner() -> None:
+    # The bishop on c3 pins the d2 pawn diagonally: pushing is illegal, capturing the bishop is not
+    board = Board.from_fen("4k3/8/8/8/8/2b5/3P4/4K3 w")
+    assert _move_strings(board, "d2") == {"d2c3"}
+
+
+def test_single_check_is_answered_by_capture_block_or_king_move() -> None:
+    # The rook on a4 checks the king on h4 along the fourth rank
+    board = Board.from_fen("4k3/8/8/8/r6K/8/1NP5/8 w")
+    non_king = {move for move in _move_strings(board) if not move.startswith("h4")}
+    # Knight captures or blocks, pawn blocks with a double push
+    assert non_king == {"b2a4", "b2c4", "c2c4"}
+
+
+def test_double_check_allows_only_king_moves() -> None:
+    # Rook e8 and knight d3 both give check; the rook on a1 could capture neither anyway
+    board = Board.from_fen("4r1k1/8/8/8/8/3n4/8/R3K3 w")
+    moves = board.generate_legal_moves()
+    assert moves
+    assert all(Board.square_to_str(move.from_sq) == "e1" for move in moves)
+
+
+def test_king_cannot_retreat_along_checking_ray() -> None:
+    # e3 is hidden behind the king from the e8 rook, but attacked once the king steps there
+    board = Board.from_fen("4r1k1/8/8/8/4K3/8/8/8 w")
+    assert _move_strings(board) == {"e4d3", "e4d4", "e4d5", "e4f3", "e4f4", "e4f5"}
+
+
+def test_perft_node_counts() -> None:
+    # Castling and en passant are not implemented, so counts follow the engine's own rules
+    assert _perft(Board.start_position(), 3) == 8902
+    assert _perft(Board.from_fen("8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w"), 3) == 2810
+
+
+def test_legal_moves_match_make_and_test_filter() -> None:
+    rng = random.Random(2026)
+    fens = (
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w",
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w",
+        "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w",
+        "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w",
+    )
+    for fen in fens:
+        for _ in range(40):
+            board = Board.from_fen(fen)
+            for _ in range(rng.randrange(1, 25)):
+                for side in (0, 1):
+                    expected = []
+                    for move in _pseudo_moves(board, side):
+                        undo = board.make(move)
+                        if not board.in_check(side):
+                            expected.append(move)
+                        board.unmake(undo)
+                    enemy_occ = board.occupancy[side ^ 1]
+                    tactical = [
+                        m for m in expected if m >= 4096 or (enemy_occ >> ((m >> 6) & 63)) & 1
+                    ]
+                    assert sorted(_legal(board, side)) == sorted(expected), board.to_fen()
+                    assert sorted(_legal(board, side, True)) == sorted(tactical), board.to_fen()
+                moves = _legal(board, board.side)
+                if not moves:
+                    break
+                board.make(rng.choice(moves))
+
+
+def test_cached_legal_moves_are_not_shared() -> None:
+    board = Board.start_position()
+    moves = board.generate_legal_moves()
+    moves.clear()
+    assert len(board.generate_legal_moves()) == 20
+    assert len(board.apply_move(board.generate_legal_moves()[0]).generate_legal_moves()) == 20
+
+
+def test_ordered_moves_put_captures_then_killers_first() -> None:
+    from chess_ai.board import Move
+
+    # White can capture the queen on d5 with the pawn or the knight
+    board = Board.from_fen("4k3/8/8/3q4/4P3/2N5/8/4K3 w")
+    killer = Move.from_long_algebraic("e1f2")
+    moves = [move.to_long_algebraic() for move in board.generate_ordered_moves(killers=[killer])]
+    assert moves[:3] == ["e4d5", "c3d5", "e1f2"]
+
+
+def test_check_cache_is_not_shared_between_boards() -> None:
+    first = Board.start_position()
+    assert not first.is_in_check("white")
+    assert not first.is_in_check("white")
+    second = Board.start_position()
+    assert (first.check_cache_info().hits, first.check_cache_info().misses) == (1, 1)
+    assert second.check_cache_info().size == 0
+    assert first.clone().check_cache_info().size == 0
\ No newline at end of file